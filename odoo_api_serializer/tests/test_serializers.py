@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import itertools
+from datetime import date, datetime
+
+from odoo.tests.common import BaseCase
+
+from odoo.addons.odoo_api_serializer.utils.serializers import _DT_CACHE_SIZE, BaseSerializer, Field
+
+# Sample inputs per field type, valid and invalid; the first one is also
+# used as the field default
+SAMPLES = {
+    'char': ['abc', 1, True, [1]],
+    'text': ['long text', 2.5, False],
+    'integer': [3, 3.0, 3.5, True, '3'],
+    'float': [1.5, 2, True, 'x'],
+    'boolean': [True, 0, 'true'],
+    'date': ['2025-10-28', '28/10/2025', date(2025, 10, 28), 5],
+    'datetime': ['2025-10-28 12:00:00', '2025-10-28', datetime(2025, 10, 28, 12, 0), 'bad'],
+    'selection': ['a', 'z', 1],
+    'list': [[1, 2], {}, 'x'],
+    'dict': [{'k': 1}, [], 'x'],
+}
+
+
+class ParentSerializer(BaseSerializer):
+    date_format = "%d/%m/%Y"
+
+    name = Field(type='char')
+    released = Field(type='date')
+    secret = Field(type='char')
+
+
+class ChildSerializer(ParentSerializer):
+    date_format = "%Y-%m-%d"
+
+    genre = Field(type='selection', selection=('action', 'drama'))
+    secret = None
+
+
+class TestFieldCollection(BaseCase):
+
+    def test_inherited_fields_are_collected(self):
+        self.assertEqual(list(ParentSerializer._fields), ['name', 'released', 'secret'])
+        self.assertEqual(list(ChildSerializer._fields), ['name', 'released', 'genre'])
+
+    def test_non_field_attribute_shadows_inherited_field(self):
+        serializer = ChildSerializer({'name': 'x', 'secret': 's'}, mode='create')
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.cleaned_data(), {'name': 'x'})
+
+    def test_child_formats_do_not_leak_into_parent(self):
+        parent = ParentSerializer({'released': '28/10/2025'}, mode='write')
+        self.assertTrue(parent.is_valid())
+        child = ChildSerializer({'released': '2025-10-28'}, mode='write')
+        self.assertTrue(child.is_valid())
+        self.assertEqual(parent.cleaned_data(), child.cleaned_data())
+        self.assertEqual(ParentSerializer._fields['released']._date_format, "%d/%m/%Y")
+
+    def test_shared_field_is_bound_per_class(self):
+        shared = Field(type='date')
+        first = type('FirstSerializer', (BaseSerializer,), {'date_format': "%d/%m/%Y", 'day': shared})
+        second = type('SecondSerializer', (BaseSerializer,), {'day': shared})
+        self.assertEqual(first._fields['day'].to_internal_value('28/10/2025'), date(2025, 10, 28))
+        self.assertEqual(second._fields['day'].to_internal_value('2025-10-28'), date(2025, 10, 28))
+        with self.assertRaises(ValueError):
+            first._fields['day'].to_internal_value('2025-10-28')
+
+    def test_fields_are_read_only(self):
+        serializer = ParentSerializer(mode='create')
+        with self.assertRaises(TypeError):
+            serializer.fields['extra'] = Field(type='char')
+        with self.assertRaises(TypeError):
+            del serializer.fields['name']
+        self.assertIn('name', ParentSerializer(mode='create').fields)
+
+
+class TestDateCache(BaseCase):
+
+    def test_repeated_string_returns_cached_object(self):
+        for field_type in ('date', 'datetime'):
+            field = Field(type=field_type)
+            first = field.to_internal_value('2025-10-28')
+            self.assertIs(field.to_internal_value('2025-10-28'), first)
+            self.assertEqual(list(field._dt_cache), ['2025-10-28'])
+
+    def test_cache_is_cleared_when_full(self):
+        field = Field(type='datetime')
+        values = [f'2025-10-28 00:{i // 60:02d}:{i % 60:02d}' for i in range(_DT_CACHE_SIZE + 1)]
+        for value in values[:-1]:
+            field.to_internal_value(value)
+        self.assertEqual(len(field._dt_cache), _DT_CACHE_SIZE)
+        field.to_internal_value(values[-1])
+        self.assertEqual(list(field._dt_cache), [values[-1]])
+
+    def test_failed_parse_is_not_cached(self):
+        for field_type in ('date', 'datetime'):
+            field = Field(type=field_type)
+            with self.assertRaises(ValueError):
+                field.to_internal_value('28/10/2025')
+            self.assertEqual(field._dt_cache, {})
+
+    def test_cache_is_replaced_when_formats_are_rebound(self):
+        parent_field = ParentSerializer._fields['released']
+        child_field = ChildSerializer._fields['released']
+        self.assertIsNot(child_field._dt_cache, parent_field._dt_cache)
+
+        parent_field.to_internal_value('28/10/2025')
+        self.assertNotIn('28/10/2025', child_field._dt_cache)
+        with self.assertRaises(ValueError):
+            child_field.to_internal_value('28/10/2025')
+
+
+class TestFormatValidation(BaseCase):
+
+    def test_formats_strptime_cannot_parse_are_rejected(self):
+        for attr in ('date_format', 'datetime_format'):
+            for fmt in ('%-d/%m', '%s', '%G-%V'):
+                with self.subTest(attr=attr, fmt=fmt), self.assertRaises(ValueError):
+                    type('BadFormatSerializer', (BaseSerializer,), {attr: fmt})
+
+    def test_timezone_formats_are_accepted(self):
+        serializer_cls = type('TzSerializer', (BaseSerializer,), {
+            'date_format': "%Y-%m-%d %Z",
+            'datetime_format': "%Y-%m-%dT%H:%M:%S%z",
+            'moment': Field(type='datetime'),
+        })
+        serializer = serializer_cls({'moment': '2025-10-28T12:00:00+0200'}, mode='create')
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.cleaned_data()['moment'].utcoffset().total_seconds(), 7200)
+
+
+class RangeSerializer(BaseSerializer):
+    start = Field(type='integer')
+    end = Field(type='integer')
+
+    def validate_end(self, value):
+        # Cross-field check: reads the field validated before this one
+        if 'start' in self.validated_data and value < self.validated_data['start']:
+            raise ValueError("End must not be before start")
+        return value
+
+
+class TestIsValid(BaseCase):
+
+    def _serializers(self, data, mode='create'):
+        """Yield a serializer for the compiled path, then one for the generic path."""
+        yield RangeSerializer(data, mode=mode)
+        serializer = RangeSerializer(data, mode=mode)
+        # Replacing the fields mapping forces the generic path
+        serializer.fields = dict(serializer.fields)
+        yield serializer
+
+    def test_validator_reads_earlier_fields(self):
+        for serializer in self._serializers({'start': 5, 'end': 1}):
+            self.assertFalse(serializer.is_valid())
+            self.assertEqual(serializer.errors, {'end': "End must not be before start"})
+
+        for serializer in self._serializers({'start': 1, 'end': 5}):
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(serializer.cleaned_data(), {'start': 1, 'end': 5})
+
+    def test_results_reset_between_calls(self):
+        for serializer in self._serializers({'start': 5, 'end': 1}):
+            self.assertFalse(serializer.is_valid())
+            serializer.initial_data = {'end': 1}
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(serializer.cleaned_data(), {'end': 1})
+
+
+class TestCompiledIsValid(BaseCase):
+    """The generated `is_valid` must match the generic implementation."""
+
+    @classmethod
+    def _make_serializer(cls, field_type, required, default):
+        def validate_value(self, value):
+            if value == SAMPLES[field_type][0]:
+                raise ValueError("Rejected by validator")
+            return value
+
+        def validate_other(self, value):
+            # Cross-field validator: depends on the results for `value`
+            if 'value' in self.errors:
+                raise ValueError("Depends on an invalid value")
+            if 'value' in self.validated_data:
+                return f"{value}:{self.validated_data['value']!r}"
+            return value
+
+        extra = {'selection': ('a', 'b')} if field_type == 'selection' else {}
+        attrs = {
+            'value': Field(type=field_type, required=required, default=default, **extra),
+            'other': Field(type='char'),
+            'validate_value': validate_value,
+            'validate_other': validate_other,
+        }
+        return type(f'{field_type.title()}Serializer', (BaseSerializer,), attrs)
+
+    def _run(self, serializer, generic):
+        if generic:
+            # Replacing the fields mapping forces the generic path
+            serializer.fields = dict(serializer.fields)
+        result = serializer.is_valid()
+        return result, serializer.validated_data, serializer.errors
+
+    def test_compiled_matches_generic(self):
+        for field_type, samples in SAMPLES.items():
+            for required, default in itertools.product((False, True), (None, samples[0])):
+                serializer_cls = self._make_serializer(field_type, required, default)
+                self.assertIsNotNone(serializer_cls._is_valid_compiled)
+
+                payloads = [{}, {'value': None}, {'other': 'x'}]
+                payloads += [{'value': sample, 'other': 'x'} for sample in samples]
+                for mode, payload in itertools.product(('create', 'write'), payloads):
+                    with self.subTest(type=field_type, required=required, default=default,
+                                      mode=mode, payload=payload):
+                        self.assertEqual(
+                            self._run(serializer_cls(payload, mode=mode), generic=False),
+                            self._run(serializer_cls(payload, mode=mode), generic=True),
+                        )
@@ -1,4 +1,7 @@
-from datetime import datetime, date
+import copy
+import functools
+import types
+from datetime import datetime, date, timezone
 FIELD_TYPES = [
     'char',
     'text',
@@ -14,6 +17,10 @@ FIELD_TYPES = [
 
 
 FIELD_TYPES_SET = set(FIELD_TYPES)
+_FIELD_TYPES_STR = ', '.join(FIELD_TYPES)
+
+# Marks a key absent from the input data (None is a valid input value)
+_MISSING = object()
 
 
 class Field:
@@ -21,13 +28,21 @@ class Field:
     Defines a field used for validating and cleaning input dictionaries.
     Similar to DRF's basic Field, without model mapping.
     """
+    # One Field exists per declared column; slots keep them small.
+    # The underscored slots are derived state set in __init__/_bind_formats.
+    __slots__ = (
+        'type', 'required', 'default', 'selection',
+        '_selection_set', '_selection_str',
+        '_date_format', '_datetime_format',
+        '_convert', '_dt_parsers', '_dt_cache',
+    )
 
     def __init__(self, *, type, required=False, default=None, selection=None):
         if not type:
             raise ValueError("`type` is required when defining a Field.")
         if type not in FIELD_TYPES_SET:
             raise ValueError(
-                f"Invalid field type '{type}'. Must be one of: {', '.join(FIELD_TYPES)}"
+                f"Invalid field type '{type}'. Must be one of: {_FIELD_TYPES_STR}"
             )
 
         # If the type is 'selection', ensure valid selection list
@@ -36,85 +51,248 @@ class Field:
                 raise ValueError("`selection` must be provided as a list or tuple when type='selection'.")
             if not all(isinstance(choice, str) for choice in selection):
                 raise ValueError("All selection values must be strings.")
-            self.selection = selection
+            self.selection = tuple(selection)
+            self._selection_set = frozenset(selection)
+            self._selection_str = ', '.join(selection)
         else:
             if selection:
                 raise ValueError(f"`selection` parameter is not valid for type `{type}`.")
             else:
                 self.selection = None
+                self._selection_set = None
+                self._selection_str = None
 
         self.type = type
         self.required = required
         self.default = default
+        self._bind_formats()
+
+    def _bind_formats(self, date_format='%Y-%m-%d', datetime_format='%Y-%m-%d %H:%M:%S',
+                      date_iso=True, datetime_iso=True):
+        """
+        Set the date/datetime formats and bind the matching converter.
+        `date_iso`/`datetime_iso` tell whether each format can use the
+        `fromisoformat` fast path (decided once by the serializer class).
+        """
+        self._date_format = date_format
+        self._datetime_format = datetime_format
+        if self.type == 'date':
+            self._dt_parsers = _build_parsers(date_format, date_iso)
+        elif self.type == 'datetime':
+            self._dt_parsers = _build_parsers(datetime_format, datetime_iso) + tuple(
+                _as_midnight(parser) for parser in _build_parsers(date_format, date_iso)
+            )
+        else:
+            self._dt_parsers = None
+        self._dt_cache = {}
+        self._convert = _CONVERTERS[self.type](self)
 
     def to_internal_value(self, value):
         """Convert input JSON value into the correct Python type."""
         if value is None:
             return self.default
 
+        ok, result = self._convert(value)
+        if not ok:
+            raise ValueError(f"Invalid value for {self.type}: {result}")
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Converters: each builder receives the Field and returns a callable that
+# converts a single (non-None) value. Converters return `(True, value)` or
+# `(False, error message)` instead of raising, since invalid input is a
+# normal outcome of validation.
+# ---------------------------------------------------------------------------
+
+def _convert_char(value):
+    # Exact builtin types (what json.loads produces) are checked first;
+    # the isinstance checks below only run for subclasses/other objects
+    t = type(value)
+    if t is str:
+        return True, value
+    # Strictly ensure it's a non-numeric string nor a boolean value
+    if t is int or t is float or t is bool or isinstance(value, (int, float)):
+        return False, "Expected string, got number"
+    return True, str(value)
+
+
+def _convert_integer(value):
+    t = type(value)
+    if t is int:
+        return True, value
+    elif isinstance(value, float) and value.is_integer():
+        return True, int(value)
+    return False, "Expected integer"
+
+
+def _convert_float(value):
+    t = type(value)
+    if t is float:
+        return True, value
+    if t is not int and not isinstance(value, (int, float)):
+        return False, "Expected float or integer"
+    return True, float(value)
+
+
+def _convert_boolean(value):
+    # bool cannot be subclassed, so the identity check is exact
+    if type(value) is not bool:
+        return False, "Expected boolean"
+    return True, value
+
+
+def _convert_list(value):
+    if type(value) is not list and not isinstance(value, list):
+        return False, "Expected list (ex. [1, 2, 3])."
+    return True, value
+
+
+def _convert_dict(value):
+    if type(value) is not dict and not isinstance(value, dict):
+        return False, "Expected dict (JSON object)."
+    return True, value
+
+
+# Formats `datetime.fromisoformat` parses exactly like strptime, mapped to
+# their date/time separator
+_ISO_DATE_FORMAT = '%Y-%m-%d'
+_ISO_DATETIME_FORMATS = {
+    '%Y-%m-%d %H:%M:%S': ' ',
+    '%Y-%m-%dT%H:%M:%S': 'T',
+}
+
+# Max number of parsed strings remembered per date/datetime field. Payloads
+# often repeat the same timestamps across rows; dates are immutable so the
+# parsed objects can be shared safely.
+_DT_CACHE_SIZE = 128
+
+
+def _is_iso_date(value):
+    return len(value) == 10 and value[4] == '-' and value[7] == '-'
+
+
+def _is_iso_datetime(value, sep):
+    return (
+        len(value) == 19 and value[10] == sep and value[13] == ':' and value[16] == ':'
+        and value[4] == '-' and value[7] == '-'
+    )
+
+
+def _build_parsers(fmt, iso):
+    """
+    Return the ordered parsers turning a string in `fmt` into a datetime.
+    ISO formats (`iso=True`) try the much faster `fromisoformat` first;
+    strptime always comes last (and is the source of error messages).
+    """
+    strptime_parser = functools.partial(_strptime, fmt=fmt)
+    if not iso:
+        return (strptime_parser,)
+    sep = _ISO_DATETIME_FORMATS.get(fmt)
+    if sep is None:
+        is_iso = _is_iso_date
+    else:
+        is_iso = functools.partial(_is_iso_datetime, sep=sep)
+
+    def iso_parser(value):
+        if not is_iso(value):
+            raise ValueError(f"'{value}' is not an ISO string")
+        return datetime.fromisoformat(value)
+    return (iso_parser, strptime_parser)
+
+
+def _strptime(value, fmt):
+    return datetime.strptime(value, fmt)
+
+
+def _as_midnight(parser):
+    """Wrap a date parser so its result is a datetime at 00:00:00."""
+    def parse(value):
+        return datetime.combine(parser(value).date(), datetime.min.time())
+    return parse
+
+
+def _cache_put(cache, key, value):
+    if len(cache) >= _DT_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def _build_date_converter(field):
+    fmt = field._date_format
+    *fast_parsers, last_parser = field._dt_parsers
+    cache = field._dt_cache
+
+    def convert(value):
+        if isinstance(value, date):
+            return True, value
+        if not isinstance(value, str):
+            return False, f"Expected date string ({fmt})"
+        hit = cache.get(value)
+        if hit is not None:
+            return True, hit
+        for parse in fast_parsers:
+            try:
+                return True, _cache_put(cache, value, parse(value).date())
+            except ValueError:
+                pass
         try:
-            if self.type in ('char', 'text'):
-                # Strictly ensure it's a non-numeric string nor a boolean value
-                if isinstance(value, (int, float)):
-                    raise ValueError("Expected string, got number")
-                if isinstance(value, bool):
-                    raise ValueError("Expected string, got boolean")
-                return str(value)
-            elif self.type == 'integer':
-                if type(value) is int:
-                    return int(value)
-                elif isinstance(value, float) and value.is_integer():
-                    return int(value)
-                raise ValueError("Expected integer")
-            elif self.type == 'float':
-                if not isinstance(value, (int, float)):
-                    raise ValueError("Expected float or integer")
-                return float(value)
-            elif self.type == 'boolean':
-                if not isinstance(value, bool):
-                    raise ValueError("Expected boolean")
-                return value
-            elif self.type == 'date':
-                if isinstance(value, date):
-                    return value
-                if not isinstance(value, str):
-                    raise ValueError(f"Expected date string ({getattr(self, '_date_format', '%Y-%m-%d')})")
-                fmt = getattr(self, '_date_format', '%Y-%m-%d')
-                return datetime.strptime(value, fmt).date()
-            elif self.type == 'datetime':
-                if isinstance(value, datetime):
-                    return value
-                if not isinstance(value, str):
-                    raise ValueError(
-                        f"Expected datetime string ({getattr(self, '_datetime_format', '%Y-%m-%d %H:%M:%S')})")
-                fmt = getattr(self, '_datetime_format', '%Y-%m-%d %H:%M:%S')
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    # fallback: try date-only format (also uses serializer’s date_format)
-                    fmt_date = getattr(self, '_date_format', '%Y-%m-%d')
-                    try:
-                        dt = datetime.strptime(value, fmt_date)
-                        return datetime.combine(dt.date(), datetime.min.time())
-                    except ValueError:
-                        raise ValueError(f"Invalid datetime format. Expected '{fmt}' or '{fmt_date}'")
-            elif self.type == 'selection':
-                if not isinstance(value, str):
-                    raise ValueError("Expected string for selection field.")
-                if value not in self.selection:
-                    raise ValueError(f"Invalid selection value '{value}'. Must be one of: ({', '.join(self.selection)})")
-                return value
-            elif self.type == 'list':
-                if not isinstance(value, list):
-                    raise ValueError("Expected list (ex. [1, 2, 3]).")
-                return value
-            elif self.type == 'dict':
-                if not isinstance(value, dict):
-                    raise ValueError("Expected dict (JSON object).")
-                return value
-
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid value for {self.type}: {e}")
+            return True, _cache_put(cache, value, last_parser(value).date())
+        except ValueError as e:
+            return False, str(e)
+    return convert
+
+
+def _build_datetime_converter(field):
+    fmt = field._datetime_format
+    fmt_date = field._date_format
+    parsers = field._dt_parsers
+    cache = field._dt_cache
+
+    def convert(value):
+        if isinstance(value, datetime):
+            return True, value
+        if not isinstance(value, str):
+            return False, f"Expected datetime string ({fmt})"
+        hit = cache.get(value)
+        if hit is not None:
+            return True, hit
+        # datetime_format parsers first, then date-only fallbacks
+        for parse in parsers:
+            try:
+                return True, _cache_put(cache, value, parse(value))
+            except ValueError:
+                pass
+        return False, f"Invalid datetime format. Expected '{fmt}' or '{fmt_date}'"
+    return convert
+
+
+def _build_selection_converter(field):
+    choices = field._selection_set
+    choices_str = field._selection_str
+
+    def convert(value):
+        if type(value) is not str and not isinstance(value, str):
+            return False, "Expected string for selection field."
+        if value not in choices:
+            return False, f"Invalid selection value '{value}'. Must be one of: ({choices_str})"
+        return True, value
+    return convert
+
+
+_CONVERTERS = {
+    'char': lambda field: _convert_char,
+    'text': lambda field: _convert_char,
+    'integer': lambda field: _convert_integer,
+    'float': lambda field: _convert_float,
+    'boolean': lambda field: _convert_boolean,
+    'date': _build_date_converter,
+    'datetime': _build_datetime_converter,
+    'selection': _build_selection_converter,
+    'list': lambda field: _convert_list,
+    'dict': lambda field: _convert_dict,
+}
 
 
 class BaseSerializer:
@@ -122,8 +300,19 @@ class BaseSerializer:
     Base serializer that validates and cleans input data (dict).
     It removes unwanted keys and ensures correct types/defaults.
     """
+    # Per-instance state only; declared fields and formats live on the class.
+    # Subclasses without their own __slots__ still get a __dict__.
+    __slots__ = ('mode', 'initial_data', 'validated_data', 'errors', 'fields')
     date_format = "%Y-%m-%d"
     datetime_format = "%Y-%m-%d %H:%M:%S"
+    _fields = types.MappingProxyType({})
+    _validators = {}
+    _is_valid_compiled = None
+    _date_iso_compatible = True
+    _dt_iso_compatible = True
+    # True when any declared field is a date/datetime, so response helpers
+    # can skip converting temporal values for this serializer's data
+    has_temporal_fields = False
 
     def __init__(self, data=None, *, mode):
         if not mode:
@@ -137,12 +326,9 @@ class BaseSerializer:
         self.initial_data = data or {}
         self.validated_data = {}
         self.errors = {}
-        self.fields = self._collect_fields()
-
-        # Assign serializer formats to all Field instances
-        for field in self.fields.values():
-            field._date_format = self.date_format
-            field._datetime_format = self.datetime_format
+        # Read-only view shared by all instances; assign a new dict to
+        # `self.fields` to change the fields of one instance
+        self.fields = type(self)._fields
 
     def __init_subclass__(cls, **kwargs):
         """Validate formats when subclass is defined"""
@@ -172,50 +358,206 @@ class BaseSerializer:
                 f"Full error: {e}"
             )
 
-    def _collect_fields(self):
-        """Collect all declared Field attributes."""
+        # --- Check both formats parse back with strptime (as used on input) ---
+        # (aware sample so %z/%Z produce parseable output)
+        aware_sample = sample_date.replace(tzinfo=timezone.utc)
+        for attr in ('date_format', 'datetime_format'):
+            fmt = getattr(cls, attr)
+            try:
+                datetime.strptime(aware_sample.strftime(fmt), fmt)
+            except ValueError as e:
+                raise ValueError(
+                    f"[{cls.__name__}] Invalid {attr} '{fmt}'.\n"
+                    f"Values formatted with it can't be parsed back with strptime.\n"
+                    f"Full error: {e}"
+                )
+        cls._date_iso_compatible = cls.date_format == _ISO_DATE_FORMAT
+        cls._dt_iso_compatible = cls.datetime_format in _ISO_DATETIME_FORMATS
+
+        # --- Collect declared fields once per class (base classes first) ---
         fields = {}
-        for name, attr in self.__class__.__dict__.items():
-            if isinstance(attr, Field):
-                fields[name] = attr
-        return fields
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, Field):
+                    fields[name] = attr
+                elif name in fields:
+                    # Field shadowed by a non-field attribute in a subclass
+                    del fields[name]
+
+        for name, field in fields.items():
+            # Each class binds its own copy, so the formats below don't leak
+            # into a parent serializer or another class sharing the Field
+            field = copy.copy(field)
+            fields[name] = field
+            field._bind_formats(
+                cls.date_format, cls.datetime_format,
+                cls._date_iso_compatible, cls._dt_iso_compatible,
+            )
+        cls._fields = types.MappingProxyType(fields)
+        cls.has_temporal_fields = any(field.type in ('date', 'datetime') for field in fields.values())
+
+        # --- Resolve `validate_<name>` methods once per class ---
+        # The raw class attributes are stored and bound per call with
+        # __get__, so plain, static and class methods all keep working
+        validators = {}
+        for name in fields:
+            if callable(getattr(cls, f'validate_{name}', None)):
+                validator = _getattr_static(cls, f'validate_{name}')
+                if not hasattr(type(validator), '__get__'):
+                    # Callable object (not a descriptor): call it as is
+                    validator = staticmethod(validator)
+                validators[name] = validator
+        cls._validators = validators
+
+        # --- Specialize is_valid for the declared fields ---
+        cls._is_valid_compiled = _compile_is_valid(cls.__name__, fields, cls._validators)
 
     def is_valid(self):
         """Validate input data against declared fields."""
-        self.validated_data = {}
-        self.errors = {}
+        initial_data = self.initial_data
+        is_create = self.mode == 'create'
+        compiled = type(self)._is_valid_compiled
+        # The class fields are read-only, so identity means the declared set
+        if compiled is not None and self.fields is type(self)._fields:
+            return compiled(self, initial_data, is_create)
+
+        cls = type(self)
+        cls_validators = cls._validators
+        # Filled in place so validators can read the fields validated so far
+        self.validated_data = validated = {}
+        self.errors = errors = {}
 
         for name, field in self.fields.items():
-            in_data = name in self.initial_data
-            has_default = field.default is not None
-            is_required = field.required
-            is_create = self.mode == 'create'
-            if not in_data and is_create and is_required:
-                self.errors[name] = "This field is required."
-                continue
-            if not in_data and (not has_default or not is_create):
-                continue
-            raw_value = self.initial_data.get(name, field.default) if is_create else self.initial_data.get(name)
+            raw_value = initial_data.get(name, _MISSING)
+            if raw_value is _MISSING:
+                if is_create and field.required:
+                    errors[name] = "This field is required."
+                    continue
+                if not is_create or field.default is None:
+                    continue
+                raw_value = field.default
 
-            try:
-                # Get internal value
-                value = field.to_internal_value(raw_value)
+            # Get internal value
+            if raw_value is None:
+                value = field.default
+            else:
+                ok, value = field._convert(raw_value)
+                if not ok:
+                    errors[name] = f"Invalid value for {field.type}: {value}"
+                    continue
 
-                # -- Attribute specific validation --
+            # -- Attribute specific validation --
+            validator_method = cls_validators.get(name)
+            if validator_method is not None:
+                validator_method = validator_method.__get__(self, cls)
+            else:
+                # Not resolved at class definition (ex. a field added to
+                # this instance's `fields`): look it up like any attribute
                 validator_method = getattr(self, f'validate_{name}', None)
-                if callable(validator_method):
-                    try:
-                        value = validator_method(value)
-                    except ValueError as e:
-                        self.errors[name] = str(e)
-                        continue
-
-                self.validated_data[name] = value
-            except ValueError as e:
-                self.errors[name] = str(e)
+                if not callable(validator_method):
+                    validator_method = None
+            if validator_method is not None:
+                try:
+                    value = validator_method(value)
+                except ValueError as e:
+                    errors[name] = str(e)
+                    continue
+
+            validated[name] = value
 
-        return len(self.errors) == 0
+        return len(errors) == 0
+
+    @classmethod
+    def is_valid_many(cls, records, *, mode, **kwargs):
+        """
+        Validate a list of input dicts (ex. a bulk endpoint payload).
+        Each record gets its own serializer, `cls(record, mode=mode, **kwargs)`,
+        so no state is shared between records.
+        Returns `(validated, errors)`: the cleaned dict of every record, in
+        order, and a dict mapping the index of each invalid record to its
+        field errors. All records are valid when `errors` is empty.
+        """
+        validated = []
+        errors = {}
+        for index, record in enumerate(records):
+            serializer = cls(record, mode=mode, **kwargs)
+            serializer.is_valid()
+            validated.append(serializer.cleaned_data())
+            if serializer.errors:
+                errors[index] = serializer.errors
+        return validated, errors
 
     def cleaned_data(self):
         """Return the validated and cleaned dictionary."""
         return self.validated_data
+
+
+def _getattr_static(cls, name):
+    """Return the attribute `name` as stored in the class dicts (MRO order)."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    raise AttributeError(name)
+
+
+def _compile_is_valid(cls_name, fields, validators):
+    """
+    Generate a straight-line version of `BaseSerializer.is_valid` for the
+    given fields: names, defaults, converters and validators are constants
+    of the generated code instead of being looked up per field per call.
+    Returns a function `(serializer, data, is_create) -> bool` that fills
+    `serializer.validated_data`/`serializer.errors` in place, like is_valid.
+    """
+    namespace = {'_MISSING': _MISSING}
+    lines = [
+        "def _is_valid(self, data, is_create):",
+        "    cls = type(self)",
+        "    self.validated_data = v = {}",
+        "    self.errors = e = {}",
+    ]
+    for i, (name, field) in enumerate(fields.items()):
+        key = repr(name)
+        namespace[f'_convert_{i}'] = field._convert
+        namespace[f'_default_{i}'] = field.default
+        lines += [
+            f"    x = data.get({key}, _MISSING)",
+            "    if x is _MISSING:",
+        ]
+        if field.required:
+            lines += [
+                "        if is_create:",
+                f"            e[{key}] = 'This field is required.'",
+            ]
+        elif field.default is not None:
+            lines.append(f"        x = _default_{i} if is_create else _MISSING")
+        else:
+            lines.append("        pass")
+        lines += [
+            "    if x is not _MISSING:",
+            "        if x is None:",
+            f"            x = _default_{i}",
+            "        else:",
+            f"            ok, x = _convert_{i}(x)",
+            "            if not ok:",
+            f"                e[{key}] = {'Invalid value for ' + field.type + ': '!r} + x",
+            "                x = _MISSING",
+        ]
+        if name in validators:
+            namespace[f'_validator_{i}'] = validators[name]
+            lines += [
+                "        if x is not _MISSING:",
+                "            try:",
+                f"                x = _validator_{i}.__get__(self, cls)(x)",
+                "            except ValueError as exc:",
+                f"                e[{key}] = str(exc)",
+                "                x = _MISSING",
+            ]
+        lines += [
+            "        if x is not _MISSING:",
+            f"            v[{key}] = x",
+        ]
+    lines.append("    return len(e) == 0")
+
+    code = compile("\n".join(lines), f"<{cls_name}._is_valid>", 'exec')
+    exec(code, namespace)
+    return namespace['_is_valid']